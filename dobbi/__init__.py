@@ -38,10 +38,12 @@ So, chain .punctuation() as one of the last functions.
 from dobbi.job import CleanJob, ReplaceJob, CollectionJob
 
 
-def clean() -> CleanJob:
+def clean(backend: str = None) -> CleanJob:
     """
     Initialization function. Initializes a work to clean the provided string by chaining.
 
+    :param backend: Pass 're2' to run the fused patterns through google-re2
+        when it is installed; the default uses the built-in re module.
     :return: Instance of the Work object.
 
     Example:
@@ -55,13 +57,15 @@ def clean() -> CleanJob:
 
     'Why is so harmful?'
     """
-    return CleanJob()
+    return CleanJob(backend)
 
 
-def replace() -> ReplaceJob:
+def replace(backend: str = None) -> ReplaceJob:
     """
     Initialization function. Initializes a work to change the provided string with some token.
 
+    :param backend: Pass 're2' to run the fused patterns through google-re2
+        when it is installed; the default uses the built-in re module.
     :return: Instance of the Work object.
 
     Example:
@@ -75,7 +79,7 @@ def replace() -> ReplaceJob:
 
     'Why TOKEN_HASHTAG  USER is so harmful?'
     """
-    return ReplaceJob()
+    return ReplaceJob(backend)
 
 
 def collect() -> CollectionJob:
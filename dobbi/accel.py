@@ -0,0 +1,243 @@
+"""
+Optional accelerated kernels for the hot loops in dobbi.job.
+
+Every backend here is a soft dependency: when the third-party package is not
+installed, the corresponding module constant stays None and the callers in
+dobbi.job fall back to the pure-Python path.
+"""
+
+import string
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Iterator, List, Tuple
+
+from dobbi.collections.emoji import EMOJI
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.compute as pyarrow_compute
+except ImportError:
+    pyarrow = None
+    pyarrow_compute = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# True for the byte values of \t\n\v\f\r; indexing the table with a uint8
+# buffer gives a vectorized whitespace mask.
+_WS_BYTE_MASK = None
+if numpy is not None:
+    _WS_BYTE_MASK = numpy.zeros(256, dtype=bool)
+    _WS_BYTE_MASK[[9, 10, 11, 12, 13]] = True
+
+# A single Aho-Corasick automaton over all emoji keys, so every emoji pass
+# is O(len(text)) instead of one full scan per key.
+EMOJI_AUTOMATON = None
+if ahocorasick is not None:
+    EMOJI_AUTOMATON = ahocorasick.Automaton()
+    for _key, _token in EMOJI.items():
+        EMOJI_AUTOMATON.add_word(_key, (len(_key), _token))
+    EMOJI_AUTOMATON.make_automaton()
+
+
+def emoji_spans(s_: str) -> Iterator[Tuple[int, int, str]]:
+    """
+    Finds all the emoji occurrences in a single automaton pass.
+
+    :param s_: The string to scan.
+    :return: (start, end, token) triples for the longest non-overlapping matches.
+    """
+
+    for end, (length, token) in EMOJI_AUTOMATON.iter_long(s_):
+        yield end - length + 1, end + 1, token
+
+
+def emoji_sub(s_: str, repl: Callable[[str], str]) -> str:
+    """
+    Rebuilds the string with every emoji replaced, in one pass and one join.
+
+    :param s_: The string to process.
+    :param repl: Maps the emoji token to its replacement.
+    :return: The processed string.
+    """
+
+    out = []
+    prev = 0
+    for start, end, token in emoji_spans(s_):
+        out.append(s_[prev:start])
+        out.append(repl(token))
+        prev = end
+    out.append(s_[prev:])
+    return ''.join(out)
+
+
+# True for the byte values of the ASCII punctuation characters.
+_PUNCT_BYTE_MASK = None
+if numpy is not None:
+    _PUNCT_BYTE_MASK = numpy.zeros(256, dtype=numpy.uint8)
+    for _c in string.punctuation.encode('ascii'):
+        _PUNCT_BYTE_MASK[_c] = 1
+
+# Compiled character kernels keyed by their (drop_punctuation, ws_to_space,
+# collapse, lower) flags, so every chain shape is compiled at most once.
+_char_kernel_cache = {}
+
+
+def char_kernel(drop_punctuation: bool, ws_to_space: bool, collapse: bool, lower: bool = False) -> Callable:
+    """
+    Builds and caches a Numba kernel fusing the character-level clean stages
+    into one pass over a uint8 buffer.
+
+    :param drop_punctuation: Whether to delete ASCII punctuation.
+    :param ws_to_space: Whether to map \\t\\n\\r\\v\\f to ' '.
+    :param collapse: Whether to collapse and strip whitespace runs.
+    :param lower: Whether to lowercase A-Z.
+    :return: A str -> str kernel for ASCII input, or None when Numba/NumPy
+        is unavailable and the caller should keep the per-stage functions.
+    """
+
+    if numba is None or numpy is None:
+        return None
+    key = (drop_punctuation, ws_to_space, collapse, lower)
+    kernel = _char_kernel_cache.get(key)
+    if kernel is None:
+        punct = _PUNCT_BYTE_MASK
+
+        @numba.njit(cache=True)
+        def _kernel(buf, out):
+            n = 0
+            prev_space = collapse
+            for i in range(buf.shape[0]):
+                c = buf[i]
+                if (ws_to_space or collapse) and (c == 32 or 9 <= c <= 13):
+                    c = 32
+                if drop_punctuation and punct[c] == 1:
+                    continue
+                if collapse:
+                    if c == 32:
+                        if prev_space:
+                            continue
+                        prev_space = True
+                    else:
+                        prev_space = False
+                if lower and 65 <= c <= 90:
+                    c += 32
+                out[n] = c
+                n += 1
+            if collapse and n > 0 and out[n - 1] == 32:
+                n -= 1
+            return n
+
+        def kernel(s_):
+            buf = numpy.frombuffer(s_.encode('ascii'), numpy.uint8)
+            out = numpy.empty_like(buf)
+            n = _kernel(buf, out)
+            return out[:n].tobytes().decode('ascii')
+
+        _char_kernel_cache[key] = kernel
+    return kernel
+
+
+def ascii_whitespace_to_space(s_: str) -> str:
+    """
+    Maps the handled whitespace symbols to ' ' with one SIMD-friendly NumPy pass.
+
+    The caller guards on s_.isascii(), so encode/decode are byte-for-byte.
+
+    :param s_: The ASCII string to process.
+    :return: The processed string.
+    """
+
+    buf = numpy.frombuffer(s_.encode('ascii'), numpy.uint8)
+    out = numpy.where(_WS_BYTE_MASK[buf], 0x20, buf)
+    return out.tobytes().decode('ascii')
+
+
+@lru_cache
+def hyperscan_db(patterns: Tuple[str, ...]):
+    """
+    Compiles and caches a hyperscan database for the given patterns.
+
+    :param patterns: The regex sources to compile, one id per pattern.
+    :return: The compiled database.
+    """
+
+    db = hyperscan.Database()
+    # UCP gives \w and \s their Unicode-aware meaning under UTF8 mode;
+    # without it they are ASCII-only and the scan would diverge from the
+    # re-based collectors it mirrors.
+    flags = hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    db.compile(
+        expressions=[p.encode() for p in patterns],
+        ids=list(range(len(patterns))),
+        flags=[flags] * len(patterns),
+    )
+    return db
+
+
+def hyperscan_findall(db, patterns_number: int, s_: str) -> List[List[str]]:
+    """
+    Scans the string once and returns the matched substrings per pattern.
+
+    Hyperscan reports a match for every end position, so the raw events are
+    reduced to leftmost-longest non-overlapping spans to mirror what
+    re.findall returns for the standard collector patterns.
+
+    :param db: The compiled database.
+    :param patterns_number: How many patterns the database holds.
+    :param s_: The string to scan.
+    :return: One list of matches per pattern id.
+    """
+
+    data = s_.encode('utf-8')
+    events = [[] for _ in range(patterns_number)]
+
+    def _on_match(id_, start, end, flags, context):
+        events[id_].append((start, end))
+
+    db.scan(data, match_event_handler=_on_match)
+
+    found = []
+    for spans in events:
+        spans.sort(key=lambda span: (span[0], -span[1]))
+        matches = []
+        prev_end = 0
+        for start, end in spans:
+            if start >= prev_end:
+                matches.append(data[start:end].decode('utf-8'))
+                prev_end = end
+        found.append(matches)
+    return found
+
+
+def emoji_count(s_: str) -> Counter:
+    """
+    Counts the emojis in a single automaton pass.
+
+    :param s_: The string to scan.
+    :return: A Counter keyed by the emoji tokens.
+    """
+
+    return Counter(token for _, _, token in emoji_spans(s_))
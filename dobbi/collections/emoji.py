@@ -2401,3 +2401,7 @@ def preprocess_emoji(s: str) -> str:
 
 
 EMOJI = {v: preprocess_emoji(k) for k, v in EMOJI.items()}
+
+# Longest key first, so multi-codepoint emojis win over their prefixes in
+# the fallback replace loops; materialized once here instead of per call.
+EMOJI_KEYS = tuple(sorted(EMOJI, key=len, reverse=True))
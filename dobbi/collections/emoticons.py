@@ -1,3 +1,5 @@
+import re
+
 EMOTICONS = {
     u":\)": "Happy face or smiley",
     u"=\)": "Happy face or smiley",
@@ -249,3 +251,11 @@ def preprocess_emoticons(s: str) -> str:
 
 
 EMOTICONS = {k: preprocess_emoticons(v) for k, v in EMOTICONS.items()}
+
+# The EMOTICONS keys are regex sources, so they join as-is into a single
+# alternation. Longest source first, so longer emoticons win over their
+# prefixes; one positional group per pattern maps a match back to its token
+# by group index.
+EMOTICON_PATTERNS = sorted(EMOTICONS, key=len, reverse=True)
+EMOTICON_RE = re.compile('|'.join('(%s)' % p for p in EMOTICON_PATTERNS))
+EMOTICON_TOKENS = [EMOTICONS[p] for p in EMOTICON_PATTERNS]
@@ -1,63 +1,579 @@
+import os
 import re
-from abc import ABC, abstractmethod
-from collections import Counter
+import string
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import repeat
 from typing import Callable, List, Dict, Tuple, Any
 
-from dobbi.collections.emoji import EMOJI
-from dobbi.collections.emoticons import EMOTICONS
+from dobbi import accel
+from dobbi.collections.emoji import EMOJI, EMOJI_KEYS
+from dobbi.collections.emoticons import EMOTICON_RE, EMOTICON_TOKENS
 
+# Patterns used by the standard chain methods, compiled once at import time
+# so the hot closures skip the re-module cache lookup on every call.
+_URL_RE = re.compile(r'https?://\S+')
+_NICK_RE = re.compile(r'@\w+')
+_HASH_RE = re.compile(r'#\w+')
+# [^>]* scans linearly; the lazy <.*?> retried from every '<' on input with
+# unclosed tags.
+_HTML_RE = re.compile(r'<[^>]*>')
+_NONWORD_RE = re.compile(r'[^\w\s]')
 
-class Job(ABC):
+# Below this size the str.translate path wins over the NumPy round-trip.
+_NUMPY_WS_MIN_LEN = 1024
+
+# Below this many strings, forking a process pool costs more than the
+# counting work it would spread, so batches stay in-process by default.
+_PARALLEL_MIN_STRINGS = 2048
+
+def _collapse_whitespace(s_: str) -> str:
     """
-    Abstract base class for the other job classes in the library.
+    Collapses whitespace runs to single spaces and strips the ends. str.split
+    with no separator does the run-collapsing and stripping in one C pass and
+    beats a compiled re.sub(r'\\s+', ' ', s_).strip() at every input size
+    measured, despite the intermediate token list.
     """
+    return ' '.join(s_.split())
 
-    def __init__(self):
-        self.f = list()
 
-    @abstractmethod
-    def function(self) -> Callable:
-        pass
+# Maps every handled whitespace symbol to ' ' in one C-level pass.
+_WS_TRANS_TO_SPACE = str.maketrans('\t\n\r\v\f', '     ')
+
+# Deletes every ASCII punctuation character; built once instead of per call,
+# and derived from string.punctuation rather than a hand-typed copy of it.
+_PUNCT_DEL = str.maketrans('', '', string.punctuation)
+
+# bytes.translate walks a flat 256-entry table, a tighter C loop than the
+# codepoint mapping str.translate uses; valid for ASCII input only. This is
+# the one place a bytes round-trip pays: compact-ASCII str is already one
+# byte per char, so byte-compiled regexes measured at parity with str ones
+# and the regex stages stay on str.
+_PUNCT_DEL_BYTES = string.punctuation.encode('ascii')
+_WS_TO_SPACE_BYTES = bytes.maketrans(b'\t\n\r\v\f', b'     ')
+
+
+def _ascii_translate(s_: str, table, delete: bytes = b'') -> str:
+    """
+    Runs a translate over the encoded bytes of an ASCII string.
+
+    :param s_: The ASCII string to process.
+    :param table: A 256-byte translation table, or None.
+    :param delete: Bytes to remove.
+    :return: The processed string.
+    """
+    return s_.encode('ascii').translate(table, delete).decode('ascii')
+
+
+# Replacement tokens padded with spaces once at import, not per match.
+_EMOJI_REPL = {token: ' ' + token + ' ' for token in EMOJI.values()}
+_EMOTICON_REPL = [' ' + token + ' ' for token in EMOTICON_TOKENS]
+
+
+# Cheap membership prefilters for the regex stages: most inputs contain no
+# URL, mention, hashtag or tag at all, and an `in` scan is far cheaper than
+# entering the regex engine just to find zero matches.
+_SENTINELS = {'url': 'http', 'nickname': '@', 'hashtag': '#', 'html': '<'}
+
+
+# The parameterless clean stages live at module scope, so chaining them
+# appends a shared function instead of allocating a closure per call.
+def _clean_url(s_: str) -> str:
+    return _URL_RE.sub('', s_) if 'http' in s_ else s_
+
+
+def _clean_nickname(s_: str) -> str:
+    return _NICK_RE.sub('', s_) if '@' in s_ else s_
+
+
+def _clean_hashtag(s_: str) -> str:
+    return _HASH_RE.sub('', s_) if '#' in s_ else s_
+
+
+def _clean_html(s_: str) -> str:
+    return _HTML_RE.sub('', s_) if '<' in s_ else s_
+
+
+def _clean_punctuation(s_: str) -> str:
+    if s_.isascii():
+        return _ascii_translate(s_, None, _PUNCT_DEL_BYTES)
+    return s_.translate(_PUNCT_DEL)
+
+
+def _clean_whitespace(s_: str) -> str:
+    if s_.isascii():
+        if accel.numpy is not None and len(s_) >= _NUMPY_WS_MIN_LEN:
+            return accel.ascii_whitespace_to_space(s_)
+        return _ascii_translate(s_, _WS_TO_SPACE_BYTES)
+    return s_.translate(_WS_TRANS_TO_SPACE)
+
+
+# The punctuation and whitespace sets are disjoint, so one merged table
+# runs .punctuation().whitespace() (either order) as a single pass.
+_PUNCT_WS_TRANS = dict(_PUNCT_DEL)
+_PUNCT_WS_TRANS.update(_WS_TRANS_TO_SPACE)
+
+
+def _clean_punct_ws(s_: str) -> str:
+    if s_.isascii():
+        return _ascii_translate(s_, _WS_TO_SPACE_BYTES, _PUNCT_DEL_BYTES)
+    return s_.translate(_PUNCT_WS_TRANS)
+
+
+@lru_cache
+def _emoji_pattern() -> 're.Pattern':
+    """
+    Compiles the escaped alternation over all emoji keys, longest-first so a
+    composed emoji wins over its prefix. Built on first use: it is only the
+    fallback when pyahocorasick is not installed, and a pattern.sub rebuilds
+    the result with one join instead of one new string per key replaced.
+    """
+    return re.compile('|'.join(map(re.escape, EMOJI_KEYS)))
+
+
+def _clean_emoji(s_: str) -> str:
+    if accel.EMOJI_AUTOMATON is not None:
+        return accel.emoji_sub(s_, lambda token: ' ')
+    return _emoji_pattern().sub(' ', s_)
+
+
+def _clean_emoticon(s_: str) -> str:
+    return EMOTICON_RE.sub(' ', s_)
+
+
+def _replace_emoji(s_: str) -> str:
+    if accel.EMOJI_AUTOMATON is not None:
+        return accel.emoji_sub(s_, _EMOJI_REPL.__getitem__)
+    return _emoji_pattern().sub(lambda m: _EMOJI_REPL[EMOJI[m.group()]], s_)
+
+
+def _replace_emoticon(s_: str) -> str:
+    return EMOTICON_RE.sub(lambda m: _EMOTICON_REPL[m.lastindex - 1], s_)
+
+
+def _collect_url(s_: str) -> Tuple[str, Counter]:
+    return 'url', Counter(_URL_RE.findall(s_)) if 'http' in s_ else Counter()
+
+
+def _collect_nickname(s_: str) -> Tuple[str, Counter]:
+    return 'nickname', Counter(_NICK_RE.findall(s_)) if '@' in s_ else Counter()
+
+
+def _collect_hashtag(s_: str) -> Tuple[str, Counter]:
+    return 'hashtag', Counter(_HASH_RE.findall(s_)) if '#' in s_ else Counter()
+
+
+def _collect_html(s_: str) -> Tuple[str, Counter]:
+    return 'html', Counter(_HTML_RE.findall(s_)) if '<' in s_ else Counter()
+
+
+def _collect_punctuation(s_: str) -> Tuple[str, Counter]:
+    return 'punctuation', Counter(_NONWORD_RE.findall(s_))
+
+
+def _collect_whitespace(s_: str) -> Tuple[str, Counter]:
+    c = Counter()
+    for ch in '\t\n\r\v\f':
+        n = s_.count(ch)
+        if n:
+            c[ch] = n
+    return 'whitespace', c
+
+
+def _collect_emoji(s_: str) -> Tuple[str, Counter]:
+    if accel.EMOJI_AUTOMATON is not None:
+        return 'emoji', accel.emoji_count(s_)
+    return 'emoji', Counter(EMOJI[g] for g in _emoji_pattern().findall(s_))
+
+
+@lru_cache
+def _collect_emoticon_with(ignore_emoji: bool, ignore_url: bool) -> Callable:
+    """
+    Caches one emoticon collector per flag pair, so jobs rebuilt in hot loops
+    share the same function object like the parameterless stages do.
+
+    :param ignore_emoji: Whether to mask emoji before the emoticon scan.
+    :param ignore_url: Whether to mask http/https patterns first.
+    :return: A str -> (tag, Counter) collector function.
+    """
+
+    def _emoticon(s_: str) -> Tuple[str, Counter]:
+        if ignore_url:
+            s_ = _URL_RE.sub(' ', s_)
+        if ignore_emoji:
+            s_ = _clean_emoji(s_)
+        c = Counter(EMOTICON_TOKENS[m.lastindex - 1] for m in EMOTICON_RE.finditer(s_))
+        return 'emoticon', c
+
+    return _emoticon
+
+
+@lru_cache(maxsize=4096)
+def _sub_with(pattern: 're.Pattern', replacement: str, sentinel: str = None) -> Callable:
+    """
+    Caches one substitution callable per (pattern, replacement) pair, so
+    chains built in hot loops reuse the same function object.
+
+    :param pattern: The compiled pattern to substitute.
+    :param replacement: The replacement string.
+    :param sentinel: A substring whose absence proves the pattern cannot
+        match, letting the callable skip the regex engine entirely.
+    :return: A str -> str substitution function.
+    """
+    func = partial(pattern.sub, replacement)
+    if sentinel is None:
+        return func
+    return lambda s_: func(s_) if sentinel in s_ else s_
+
+
+@lru_cache(maxsize=4096)
+def _translate_with(table_builder: Callable, replacement: str) -> Callable:
+    """
+    Caches one translate callable per (table, replacement) pair, mirroring
+    _sub_with for the table-based stages.
+
+    :param table_builder: The cached builder producing the translation table.
+    :param replacement: The replacement string the table maps to.
+    :return: A str -> str translation function.
+    """
+    table = table_builder(replacement)
+    return lambda s_: s_.translate(table)
+
+
+# Clean stages safe to drop when chained twice in a row: each is a fixpoint
+# (removing URLs from URL-free text is a no-op, and none of these can create
+# a new match of their own pattern). Emoticon stays out — a pattern may span
+# the space its own substitution inserts — as do custom regexps.
+_IDEMPOTENT_CLEAN = frozenset(('url', 'nickname', 'hashtag', 'html',
+                               'punctuation', 'whitespace', 'emoji'))
+
+
+# Removal stages whose patterns can be fused into one alternation pass.
+_CLEAN_FUSABLE = {
+    'url': _URL_RE.pattern,
+    'nickname': _NICK_RE.pattern,
+    'hashtag': _HASH_RE.pattern,
+    'html': _HTML_RE.pattern,
+}
+
+
+# Clean stages that pyarrow.compute can run as (pattern, replacement) kernels
+# over a whole string array at once.
+_ARROW_CLEAN = {
+    'url': (_URL_RE.pattern, ''),
+    'nickname': (_NICK_RE.pattern, ''),
+    'hashtag': (_HASH_RE.pattern, ''),
+    'html': (_HTML_RE.pattern, ''),
+    'punctuation': ('[%s]' % re.escape(string.punctuation), ''),
+    'whitespace': (r'[\t\n\r\v\f]', ' '),
+}
+
+
+# Replace stages that pyarrow.compute can run as regex kernels over a whole
+# string array; the replacement comes from the stage parameters.
+_ARROW_REPLACE = {
+    'url': _URL_RE.pattern,
+    'nickname': _NICK_RE.pattern,
+    'hashtag': _HASH_RE.pattern,
+    'html': _HTML_RE.pattern,
+    'punctuation': '[%s]' % re.escape(string.punctuation),
+    'whitespace': r'[\t\n\r\v\f]',
+}
+
+
+# Character-level stages that the optional Numba kernel can fuse. The lower
+# stage qualifies because ASCII lowercasing is a per-byte add.
+_CHAR_STAGE_TAGS = ('punctuation', 'whitespace', 'rm_whitespace', 'lower')
+
+
+def _run_length(stages: List[Tuple[str, Callable]], start: int, tags) -> int:
+    """
+    Returns the end index of the run of stages with tags from the given set.
+    """
+
+    end = start
+    while end < len(stages) and stages[end][0] in tags:
+        end += 1
+    return end
+
+
+@lru_cache(maxsize=1024)
+def _fused_compile(source: str, backend: str = None) -> 're.Pattern':
+    """
+    Compiles a fused alternation, through google-re2 when the job asked for
+    the 're2' backend and the package is installed. RE2 matches with a DFA
+    instead of backtracking, which pays off on scan-heavy corpora. Cached by
+    source, so jobs rebuilt with the same chain share the compiled pattern.
+
+    :param source: The regex source string.
+    :param backend: The requested regex backend, or None for the re module.
+    :return: The compiled pattern.
+    """
+
+    if backend == 're2' and accel.re2 is not None:
+        try:
+            return accel.re2.compile(source)
+        except accel.re2.error:
+            pass
+    return re.compile(source)
+
+
+def _fuse_clean_stages(stages: List[Tuple[str, Callable]], backend: str = None) -> List[Callable]:
+    """
+    Lowers (tag, function) stages to plain callables, merging runs of consecutive
+    removal stages into a single alternation substitution and runs of consecutive
+    character-level stages into one compiled kernel where Numba is available, so
+    a chain of standard stages makes as few passes over the string as possible.
+
+    :param stages: The chained (tag, function) stages.
+    :param backend: The regex backend for the fused patterns.
+    :return: The functions to run, in order.
+    """
+
+    lowered = []
+    i = 0
+    while i < len(stages):
+        tag = stages[i][0]
+        if tag in _CLEAN_FUSABLE:
+            end = _run_length(stages, i, _CLEAN_FUSABLE)
+            run = stages[i:end]
+            if len(run) == 1:
+                lowered.append(run[0][1])
+            else:
+                pattern = _fused_compile('|'.join(_CLEAN_FUSABLE[t] for t, _ in run), backend)
+                sentinels = tuple(_SENTINELS[t] for t, _ in run)
+                lowered.append(lambda s_, _p=pattern, _sent=sentinels:
+                               _p.sub('', s_) if any(c in s_ for c in _sent) else s_)
+            i = end
+        elif tag in _CHAR_STAGE_TAGS:
+            end = _run_length(stages, i, _CHAR_STAGE_TAGS)
+            run = stages[i:end]
+            tags = {t for t, _ in run}
+            kernel = None
+            if len(run) > 1:
+                kernel = accel.char_kernel('punctuation' in tags,
+                                           'whitespace' in tags,
+                                           'rm_whitespace' in tags,
+                                           'lower' in tags)
+            if kernel is None:
+                j = 0
+                while j < len(run):
+                    if j + 1 < len(run) and {run[j][0], run[j + 1][0]} == {'punctuation', 'whitespace'}:
+                        lowered.append(_clean_punct_ws)
+                        j += 2
+                    else:
+                        lowered.append(run[j][1])
+                        j += 1
+            else:
+                funcs = tuple(func for _, func in run)
+
+                def _chars(s_, _kernel=kernel, _funcs=funcs):
+                    if s_.isascii():
+                        return _kernel(s_)
+                    for func in _funcs:
+                        s_ = func(s_)
+                    return s_
+
+                lowered.append(_chars)
+            i = end
+        else:
+            lowered.append(stages[i][1])
+            i += 1
+    return lowered
+
+
+# Replacement stages whose patterns can be fused into one dispatching pass.
+_REPLACE_FUSABLE = {
+    'url': _URL_RE.pattern,
+    'nickname': _NICK_RE.pattern,
+    'hashtag': _HASH_RE.pattern,
+    'html': _HTML_RE.pattern,
+}
+
+
+def _fusable_replace_stage(stage: Tuple[str, Dict, Callable]) -> bool:
+    """
+    Tells whether a replace stage may join a fused alternation. One shared
+    pass cannot reproduce sequential cascades where a later pattern matches
+    an earlier stage's output, so only the standard token stages qualify,
+    and only while their replacement contains none of the other standard
+    anchors (a token carrying '@' would feed a later nickname stage under
+    sequential execution). Custom regexp stages always run standalone —
+    their output may be input to any later pattern.
+    """
+
+    tag, params, _ = stage
+    return (tag in _REPLACE_FUSABLE
+            and not any(anchor in params['replacement'] for anchor in _SENTINELS.values()))
+
+
+def _fuse_replace_stages(stages: List[Tuple[str, Dict, Callable]], backend: str = None) -> List[Callable]:
+    """
+    Lowers ReplaceJob (tag, params, function) stages to plain callables,
+    merging runs of consecutive standard token replacements into one
+    named-group alternation whose callback picks the replacement for the
+    group that matched.
+
+    :param stages: The chained (tag, params, function) stages.
+    :param backend: The regex backend for the fused patterns.
+    :return: The functions to run, in order.
+    """
+
+    lowered = []
+    i = 0
+    while i < len(stages):
+        if _fusable_replace_stage(stages[i]):
+            end = i
+            seen = set()
+            while end < len(stages) and _fusable_replace_stage(stages[end]):
+                tag = stages[end][0]
+                if tag in seen:
+                    break
+                seen.add(tag)
+                end += 1
+            run = stages[i:end]
+            if len(run) == 1:
+                lowered.append(run[0][2])
+            else:
+                parts = []
+                repls = {}
+                sentinels = []
+                for idx, stage in enumerate(run):
+                    name = 'g%d' % idx
+                    parts.append('(?P<%s>%s)' % (name, _REPLACE_FUSABLE[stage[0]]))
+                    repls[name] = stage[1]['replacement']
+                    sentinels.append(_SENTINELS.get(stage[0]))
+                pattern = _fused_compile('|'.join(parts), backend)
+                if None in sentinels:
+                    lowered.append(lambda s_, _p=pattern, _r=repls:
+                                   _p.sub(lambda m: _r[m.lastgroup], s_))
+                else:
+                    sentinels = tuple(sentinels)
+                    lowered.append(lambda s_, _p=pattern, _r=repls, _sent=sentinels:
+                                   _p.sub(lambda m: _r[m.lastgroup], s_) if any(c in s_ for c in _sent) else s_)
+            i = end
+        else:
+            lowered.append(stages[i][2])
+            i += 1
+    return lowered
+
+
+# Collectors whose patterns the hyperscan multi-pattern scanner can run in
+# one pass. Hyperscan reports matches per pattern id, so every collector
+# still counts independently — a fused single-regex alternation would not:
+# whichever alternative matched first would steal the span from the others
+# (punctuation inside a URL, the '@' of a nickname, and so on).
+_COLLECT_FUSABLE = {
+    'url': _URL_RE.pattern,
+    'nickname': _NICK_RE.pattern,
+    'hashtag': _HASH_RE.pattern,
+    'html': _HTML_RE.pattern,
+    'punctuation': _NONWORD_RE.pattern,
+}
+
+
+# Collectors whose counts are insensitive to '\n'-joined string boundaries:
+# none of these patterns can match across a newline, so scanning the joined
+# batch once equals scanning every string separately. html is excluded
+# because [^>]* crosses newlines, whitespace because it counts them.
+_JOIN_SAFE_COLLECT = ('url', 'nickname', 'hashtag', 'punctuation', 'emoji')
+
+
+@lru_cache
+def _punct_table(replacement: str) -> Dict[int, str]:
+    """
+    Builds, once per replacement, the table mapping every ASCII punctuation
+    character to the replacement.
+
+    :param replacement: The string to substitute for each punctuation character.
+    :return: A translation table for str.translate.
+    """
+    return str.maketrans({c: replacement for c in string.punctuation})
+
+
+def _specialize(funcs: Tuple[Callable, ...], cast: bool = False) -> Callable:
+    """
+    Emits one straight-line function applying the lowered stages in order, so
+    repeated runs pay a single call instead of an interpreted loop with a
+    tuple iteration and an indirection per step.
+
+    :param funcs: The lowered pipeline functions, in order.
+    :param cast: Whether to coerce the argument to str on entry.
+    :return: A function applying the whole pipeline.
+    """
+
+    if not funcs:
+        return str if cast else lambda s_: s_
+    if len(funcs) == 1 and not cast:
+        return funcs[0]
+    names = {'_f%d' % i: func for i, func in enumerate(funcs)}
+    lines = ['def _run(s_):']
+    if cast:
+        lines.append('    if not isinstance(s_, str):')
+        lines.append('        s_ = str(s_)')
+    lines.extend('    s_ = _f%d(s_)' % i for i in range(len(funcs)))
+    lines.append('    return s_')
+    exec('\n'.join(lines), names)
+    return names['_run']
+
+
+@lru_cache
+def _ws_table(replacement: str) -> Dict[int, str]:
+    """
+    Builds, once per replacement, the table mapping every handled whitespace
+    symbol to the replacement.
+
+    :param replacement: The string to substitute for each whitespace symbol.
+    :return: A translation table for str.translate.
+    """
+    return str.maketrans({c: replacement for c in '\t\n\r\v\f'})
 
-    @abstractmethod
-    def execute(self, string: str) -> str:
-        pass
 
-    @abstractmethod
-    def regexp(self, regular_expression: str) -> Callable:
-        pass
+@lru_cache(maxsize=4096)
+def _compile(pattern: str) -> re.Pattern:
+    """
+    Compiles and caches a user-provided pattern, so repeated chains reuse the
+    compiled object across CleanJob/ReplaceJob/CollectionJob instances.
 
-    @abstractmethod
-    def url(self) -> Callable:
-        pass
+    :param pattern: The regex source string.
+    :return: The compiled pattern.
+    """
+    return re.compile(pattern)
 
-    @abstractmethod
-    def nickname(self) -> Callable:
-        pass
 
-    @abstractmethod
-    def hashtag(self) -> Callable:
-        pass
+class Job:
+    """
+    Base class for the other job classes in the library.
 
-    @abstractmethod
-    def punctuation(self) -> Callable:
-        pass
+    Instances are plain slotted objects: chains are built per use and there
+    can be many of them, so the per-instance dict is dropped.
+    """
 
-    @abstractmethod
-    def whitespace(self) -> Callable:
-        pass
+    __slots__ = ('f', '_pipelines', 'backend')
 
-    @abstractmethod
-    def html(self) -> Callable:
-        pass
+    def __init__(self, backend: str = None):
+        self.f = list()
+        self._pipelines = dict()
+        self.backend = backend
 
-    @abstractmethod
-    def emoji(self) -> Callable:
-        pass
+    def _runner(self, rm_whitespace: bool, lower: bool, cast: bool = False) -> Callable:
+        """
+        Resolves the pipeline for the given options to one specialized
+        function, cached next to the lowered stage tuple.
 
-    @abstractmethod
-    def emoticon(self) -> Callable:
-        pass
+        :param lower: If the resulting string should be lowercase.
+        :param rm_whitespace: If the extra whitespace should be removed.
+        :param cast: Whether the function should coerce its argument to str.
+        :return: A function applying the whole pipeline.
+        """
+
+        key = (rm_whitespace, lower, len(self.f), 'run')
+        runner = self._pipelines.get(key)
+        if runner is None:
+            runner = _specialize(self._pipeline(rm_whitespace, lower), cast)
+            self._pipelines[key] = runner
+        return runner
 
 
 class CleanJob(Job):
@@ -65,6 +581,8 @@ class CleanJob(Job):
     An internal class for performing a clean.
     """
 
+    __slots__ = ()
+
     def function(self, rm_whitespace=True, lower=False) -> Callable:
         """
         Creates a function, which is a combination of previously selected chained functions.
@@ -74,17 +592,7 @@ class CleanJob(Job):
         :return: A function that is the combination of previously chosen chained functions.
         """
 
-        if rm_whitespace:
-            self.f.append(lambda x: ' '.join(x.split()))
-        if lower:
-            self.f.append(lambda x: x.lower())
-
-        def _func(s_) -> Callable:
-            for func in self.f:
-                s_ = func(str(s_))
-            return s_
-
-        return _func
+        return self._runner(rm_whitespace, lower, cast=True)
 
     def execute(self, string: str, rm_whitespace=True, lower=False) -> str:
         """
@@ -96,14 +604,81 @@ class CleanJob(Job):
         :return: The cleaned string.
         """
 
-        if rm_whitespace:
-            self.f.append(lambda x: ' '.join(x.split()))
-        if lower:
-            self.f.append(lambda x: x.lower())
+        return self._runner(rm_whitespace, lower, cast=True)(string)
+
+    def execute_stream(self, iterable, rm_whitespace=True, lower=False):
+        """
+        Lazily cleans an iterable of strings. The pipeline is frozen once at
+        call time, so each line pays one function call instead of the
+        execute() dispatch, and nothing is materialized.
+
+        :param iterable: The strings to process.
+        :param lower: If the resulting strings should be lowercase.
+        :param rm_whitespace: If the extra whitespace should be removed.
+        :return: An iterator over the cleaned strings.
+        """
+
+        return map(self._runner(rm_whitespace, lower, cast=True), iterable)
+
+    def batch_execute(self, strings: List[str], rm_whitespace=True, lower=False) -> List[str]:
+        """
+        Cleans a whole batch of strings. When pyarrow is installed, every
+        chained stage maps to a compute kernel and the batch is all ASCII
+        (Arrow's regexes are RE2, whose \\w is ASCII-only, unlike re's), the
+        batch is processed as one Arrow string array, moving the per-string
+        loop into C.
+
+        :param strings: The strings to process.
+        :param lower: If the resulting strings should be lowercase.
+        :param rm_whitespace: If the extra whitespace should be removed.
+        :return: The cleaned strings, in order.
+        """
+
+        if (accel.pyarrow is not None
+                and all(tag in _ARROW_CLEAN for tag, _ in self.f)
+                and all(map(str.isascii, strings))):
+            compute = accel.pyarrow_compute
+            arr = accel.pyarrow.array(strings, type=accel.pyarrow.string())
+            for tag, _ in self.f:
+                pattern, replacement = _ARROW_CLEAN[tag]
+                arr = compute.replace_substring_regex(arr, pattern=pattern, replacement=replacement)
+            if rm_whitespace:
+                arr = compute.replace_substring_regex(arr, pattern=r'\s+', replacement=' ')
+                arr = compute.utf8_trim_whitespace(arr)
+            if lower:
+                arr = compute.utf8_lower(arr)
+            return arr.to_pylist()
+        func = self._runner(rm_whitespace, lower, cast=True)
+        return [func(s_) for s_ in strings]
+
+    def _pipeline(self, rm_whitespace: bool, lower: bool) -> Tuple[Callable, ...]:
+        """
+        Lowers the chained stages plus the requested post-processing to a fused
+        tuple of callables, cached per option set, so repeated execute() calls
+        reuse the pipeline and never mutate self.f.
 
-        for func in self.f:
-            string = func(str(string))
-        return string
+        :param lower: If the resulting string should be lowercase.
+        :param rm_whitespace: If the extra whitespace should be removed.
+        :return: The functions to run, in order.
+        """
+
+        key = (rm_whitespace, lower, len(self.f))
+        pipeline = self._pipelines.get(key)
+        if pipeline is None:
+            stages = []
+            for stage in self.f:
+                # Accidental doubled calls are common in generated chains;
+                # dropping the repeat also keeps the fusion run unbroken.
+                if stages and stage == stages[-1] and stage[0] in _IDEMPOTENT_CLEAN:
+                    continue
+                stages.append(stage)
+            if rm_whitespace:
+                stages.append(('rm_whitespace', _collapse_whitespace))
+            if lower:
+                stages.append(('lower', str.lower))
+            pipeline = tuple(_fuse_clean_stages(stages, self.backend))
+            self._pipelines[key] = pipeline
+        return pipeline
 
     def regexp(self, regular_expression: str) -> Job:
         """
@@ -113,10 +688,7 @@ class CleanJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _regexp(s_: str) -> str:
-            return re.sub(regular_expression, '', s_)
-
-        self.f.append(_regexp)
+        self.f.append(('regexp', _sub_with(_compile(regular_expression), '')))
         return self
 
     def url(self) -> Job:
@@ -126,10 +698,7 @@ class CleanJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _url(s_: str) -> str:
-            return re.sub(r'https?://\S+', '', s_)
-
-        self.f.append(_url)
+        self.f.append(('url', _clean_url))
         return self
 
     def nickname(self) -> Job:
@@ -139,10 +708,7 @@ class CleanJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _nickname(s_: str) -> str:
-            return re.sub(r'@\w+', '', s_)
-
-        self.f.append(_nickname)
+        self.f.append(('nickname', _clean_nickname))
         return self
 
     def hashtag(self) -> Job:
@@ -152,10 +718,7 @@ class CleanJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _hashtag(s_: str) -> str:
-            return re.sub(r'#\w+', '', s_)
-
-        self.f.append(_hashtag)
+        self.f.append(('hashtag', _clean_hashtag))
         return self
 
     def punctuation(self) -> Job:
@@ -166,10 +729,7 @@ class CleanJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _punctuation(s_: str) -> str:
-            return s_.translate(str.maketrans('', '', r'!\"#$%&\'()*+,-./:;<=>?@[\]^_`{|}~'))
-
-        self.f.append(_punctuation)
+        self.f.append(('punctuation', _clean_punctuation))
         return self
 
     def whitespace(self) -> Job:
@@ -180,13 +740,7 @@ class CleanJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _whitespace(s_: str) -> str:
-            for ch in ['\t', '\n', '\r', '\v', '\f']:
-                if ch in s_:
-                    s_ = s_.replace(ch, ' ')
-            return s_
-
-        self.f.append(_whitespace)
+        self.f.append(('whitespace', _clean_whitespace))
         return self
 
     def html(self) -> Job:
@@ -196,10 +750,7 @@ class CleanJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _html(s_: str) -> str:
-            return re.sub(r'<.*?>', '', s_)
-
-        self.f.append(_html)
+        self.f.append(('html', _clean_html))
         return self
 
     def emoji(self) -> Job:
@@ -209,12 +760,7 @@ class CleanJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _emoji(s_: str) -> str:
-            for e in reversed(list(EMOJI.keys())):
-                s_ = s_.replace(e, ' ')
-            return s_
-
-        self.f.append(_emoji)
+        self.f.append(('emoji', _clean_emoji))
         return self
 
     def emoticon(self) -> Job:
@@ -224,12 +770,7 @@ class CleanJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _emoticon(s_: str) -> str:
-            for e in reversed(list(EMOTICONS.keys())):
-                s_ = re.sub(e, ' ', s_)
-            return s_
-
-        self.f.append(_emoticon)
+        self.f.append(('emoticon', _clean_emoticon))
         return self
 
 
@@ -238,6 +779,8 @@ class ReplaceJob(Job):
     An internal class for performing words replacement.
     """
 
+    __slots__ = ()
+
     def function(self, rm_whitespace=True, lower=False) -> Callable:
         """
         Creates a function, which is a combination of previously selected chained functions.
@@ -247,17 +790,7 @@ class ReplaceJob(Job):
         :return: A function that is the combination of previously chosen chained functions.
         """
 
-        if rm_whitespace:
-            self.f.append(lambda x: ' '.join(x.split()))
-        if lower:
-            self.f.append(lambda x: x.lower())
-
-        def _func(s_) -> Callable:
-            for func in self.f:
-                s_ = func(s_)
-            return s_
-
-        return _func
+        return self._runner(rm_whitespace, lower)
 
     def execute(self, string: str, rm_whitespace=True, lower=False) -> str:
         """
@@ -269,14 +802,88 @@ class ReplaceJob(Job):
         :return: The processed string.
         """
 
-        if rm_whitespace:
-            self.f.append(lambda x: ' '.join(x.split()))
-        if lower:
-            self.f.append(lambda x: x.lower())
+        return self._runner(rm_whitespace, lower)(string)
+
+    def execute_stream(self, iterable, rm_whitespace=True, lower=False):
+        """
+        Lazily processes an iterable of strings. The pipeline is frozen once
+        at call time, so each line pays one function call instead of the
+        execute() dispatch, and nothing is materialized.
+
+        :param iterable: The strings to process.
+        :param lower: If the resulting strings should be lowercase.
+        :param rm_whitespace: If the extra whitespace should be removed.
+        :return: An iterator over the processed strings.
+        """
+
+        return map(self._runner(rm_whitespace, lower), iterable)
+
+    def batch_execute(self, strings: List[str], rm_whitespace=True, lower=False) -> List[str]:
+        """
+        Processes a whole batch of strings. When pyarrow is installed, every
+        chained stage maps to a compute kernel and the batch is all ASCII
+        (Arrow's regexes are RE2, whose \\w is ASCII-only, unlike re's), the
+        batch is processed as one Arrow string array, moving the per-string
+        loop into C.
+
+        :param strings: The strings to process.
+        :param lower: If the resulting strings should be lowercase.
+        :param rm_whitespace: If the extra whitespace should be removed.
+        :return: The processed strings, in order.
+        """
+
+        if (accel.pyarrow is not None
+                and all(self._arrow_stage(stage) for stage in self.f)
+                and all(map(str.isascii, strings))):
+            compute = accel.pyarrow_compute
+            arr = accel.pyarrow.array(strings, type=accel.pyarrow.string())
+            for tag, params, _ in self.f:
+                arr = compute.replace_substring_regex(
+                    arr, pattern=_ARROW_REPLACE[tag], replacement=params['replacement'])
+            if rm_whitespace:
+                arr = compute.replace_substring_regex(arr, pattern=r'\s+', replacement=' ')
+                arr = compute.utf8_trim_whitespace(arr)
+            if lower:
+                arr = compute.utf8_lower(arr)
+            return arr.to_pylist()
+        func = self._runner(rm_whitespace, lower)
+        return [func(s_) for s_ in strings]
 
-        for func in self.f:
-            string = func(string)
-        return string
+    @staticmethod
+    def _arrow_stage(stage) -> bool:
+        """
+        Tells whether a chained stage maps cleanly to an Arrow regex kernel:
+        a known tag, a backslash-free replacement (RE2 rewrites treat \\ as a
+        group reference) and no Unicode punctuation opt-in.
+        """
+
+        tag, params, _ = stage
+        return (tag in _ARROW_REPLACE
+                and '\\' not in params['replacement']
+                and not params.get('unicode'))
+
+    def _pipeline(self, rm_whitespace: bool, lower: bool) -> Tuple[Callable, ...]:
+        """
+        Lowers the chained stages plus the requested post-processing to a fused
+        tuple of callables, cached per option set, so repeated execute() calls
+        reuse the pipeline and never mutate self.f.
+
+        :param lower: If the resulting string should be lowercase.
+        :param rm_whitespace: If the extra whitespace should be removed.
+        :return: The functions to run, in order.
+        """
+
+        key = (rm_whitespace, lower, len(self.f))
+        pipeline = self._pipelines.get(key)
+        if pipeline is None:
+            stages = list(self.f)
+            if rm_whitespace:
+                stages.append(('rm_whitespace', {}, _collapse_whitespace))
+            if lower:
+                stages.append(('lower', {}, str.lower))
+            pipeline = tuple(_fuse_replace_stages(stages, self.backend))
+            self._pipelines[key] = pipeline
+        return pipeline
 
     def regexp(self, regular_expression: str, replacement='TOKEN_CUSTOM') -> Job:
         """
@@ -287,10 +894,8 @@ class ReplaceJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _regexp(s_: str) -> str:
-            return re.sub(regular_expression, replacement, s_)
-
-        self.f.append(_regexp)
+        func = _sub_with(_compile(regular_expression), replacement)
+        self.f.append(('regexp', {'regular_expression': regular_expression, 'replacement': replacement}, func))
         return self
 
     def url(self, replacement='TOKEN_URL') -> Job:
@@ -301,10 +906,7 @@ class ReplaceJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _url(s_: str) -> str:
-            return re.sub(r'https?://\S+', replacement, s_)
-
-        self.f.append(_url)
+        self.f.append(('url', {'replacement': replacement}, _sub_with(_URL_RE, replacement, _SENTINELS['url'])))
         return self
 
     def nickname(self, replacement='TOKEN_NICKNAME') -> Job:
@@ -315,10 +917,7 @@ class ReplaceJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _nickname(s_: str) -> str:
-            return re.sub(r'@\w+', replacement, s_)
-
-        self.f.append(_nickname)
+        self.f.append(('nickname', {'replacement': replacement}, _sub_with(_NICK_RE, replacement, _SENTINELS['nickname'])))
         return self
 
     def hashtag(self, replacement='TOKEN_HASHTAG') -> Job:
@@ -329,25 +928,25 @@ class ReplaceJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _hashtag(s_: str) -> str:
-            return re.sub(r'#\w+', replacement, s_)
-
-        self.f.append(_hashtag)
+        self.f.append(('hashtag', {'replacement': replacement}, _sub_with(_HASH_RE, replacement, _SENTINELS['hashtag'])))
         return self
 
-    def punctuation(self, replacement=' ') -> Job:
+    def punctuation(self, replacement=' ', unicode=False) -> Job:
         """
         Replaces all the characters from the following list:
         !"#$%&'()*+,-./:;<=>?@[\]^_`{|}~
 
         :param replacement: Token to replace.
+        :param unicode: If non-ASCII punctuation should be replaced as well,
+            which needs a Unicode-aware regex pass instead of a translate table.
         :return: The instance of Job to be chained.
         """
 
-        def _punctuation(s_: str) -> str:
-            return re.sub(r'[^\w\s]', replacement, s_)
-
-        self.f.append(_punctuation)
+        if unicode:
+            func = _sub_with(_NONWORD_RE, replacement)
+        else:
+            func = _translate_with(_punct_table, replacement)
+        self.f.append(('punctuation', {'replacement': replacement, 'unicode': unicode}, func))
         return self
 
     def whitespace(self, replacement=' ') -> Job:
@@ -359,13 +958,11 @@ class ReplaceJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _whitespace(s_: str) -> str:
-            for ch in ['\t', '\n', '\r', '\v', '\f']:
-                if ch in s_:
-                    s_ = s_.replace(ch, replacement)
-            return s_
-
-        self.f.append(_whitespace)
+        if replacement == ' ':
+            func = _clean_whitespace
+        else:
+            func = _translate_with(_ws_table, replacement)
+        self.f.append(('whitespace', {'replacement': replacement}, func))
         return self
 
     def html(self, replacement='TOKEN_HTML') -> Job:
@@ -376,10 +973,7 @@ class ReplaceJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _html(s_: str) -> str:
-            return re.sub(r'<.*?>', replacement, s_)
-
-        self.f.append(_html)
+        self.f.append(('html', {'replacement': replacement}, _sub_with(_HTML_RE, replacement, _SENTINELS['html'])))
         return self
 
     def emoji(self) -> Job:
@@ -389,13 +983,7 @@ class ReplaceJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _emoji(s_: str) -> str:
-            for e in reversed(list(EMOJI.keys())):
-                token = ' ' + EMOJI[e] + ' '
-                s_ = s_.replace(e, token)
-            return s_
-
-        self.f.append(_emoji)
+        self.f.append(('emoji', {}, _replace_emoji))
         return self
 
     def emoticon(self) -> Job:
@@ -405,13 +993,7 @@ class ReplaceJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _emoticon(s_: str) -> str:
-            for e in reversed(list(EMOTICONS.keys())):
-                token = ' ' + EMOTICONS[e] + ' '
-                s_ = re.sub(e, token, s_)
-            return s_
-
-        self.f.append(_emoticon)
+        self.f.append(('emoticon', {}, _replace_emoticon))
         return self
 
 
@@ -420,6 +1002,8 @@ class CollectionJob(Job):
     An internal class for performing words collection.
     """
 
+    __slots__ = ()
+
     def function(self) -> Callable:
         """
         Creates a function, which is a combination of previously selected chained functions.
@@ -427,11 +1011,10 @@ class CollectionJob(Job):
         :return: A function that is the combination of previously chosen chained functions.
         """
 
+        stages = tuple(func for _tag, _params, func in self.f)
+
         def _func(s_) -> List[Counter]:
-            result = list()
-            for func in self.f:
-                result.append(func(s_))
-            return result
+            return [func(s_) for func in stages]
 
         return _func
 
@@ -444,30 +1027,70 @@ class CollectionJob(Job):
         """
 
         result = dict()
-        for func in self.f:
+        for _tag, _params, func in self.f:
             tag, counter = func(string)
             result[tag] = dict(counter)
         return result
 
-    def batch_execute(self, strings: List[str]) -> Dict[str, Dict]:
+    def batch_execute(self, strings: List[str], workers: int = None) -> Dict[str, Dict]:
         """
         Returns a list of strings counted. Use this method to get an answer.
 
         :param strings: The strings to process.
+        :param workers: How many worker processes to shard the strings over.
+            Defaults to the machine's core count once the batch is large
+            enough to amortize process startup; pass 1 to force in-process.
         :return: The counted patterns.
         """
 
-        result = dict()
-        for string in strings:
-            for func in self.f:
-                tag, counter = func(string)
-                if tag not in result:
-                    result[tag] = dict()
-                for k, v in counter.items():
-                    if k not in result[tag]:
-                        result[tag][k] = 0
-                    result[tag][k] += v
-        return result
+        if workers is None and len(strings) >= _PARALLEL_MIN_STRINGS:
+            workers = os.cpu_count()
+        if workers is not None and workers > 1 and len(strings) >= workers:
+            plan = tuple((tag, tuple(sorted(params.items()))) for tag, params, _ in self.f)
+            chunk_size = -(-len(strings) // workers)
+            chunks = [strings[i:i + chunk_size] for i in range(0, len(strings), chunk_size)]
+            result = defaultdict(Counter)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for part in pool.map(_collect_chunk, repeat(plan), chunks):
+                    for tag, counts in part.items():
+                        result[tag].update(counts)
+            return {tag: dict(c) for tag, c in result.items()}
+
+        result = defaultdict(Counter)
+        joined_stages = []
+        per_string = []
+        for tag, _params, func in self.f:
+            if tag in _JOIN_SAFE_COLLECT and len(strings) > 1:
+                joined_stages.append(func)
+            else:
+                per_string.append((tag, func))
+
+        if joined_stages:
+            joined = '\n'.join(strings)
+            for func in joined_stages:
+                tag, counter = func(joined)
+                result[tag].update(counter)
+
+        if per_string:
+            fused = []
+            rest = []
+            for tag, func in per_string:
+                if accel.hyperscan is not None and tag in _COLLECT_FUSABLE and tag not in fused:
+                    fused.append(tag)
+                else:
+                    rest.append((tag, func))
+            db = accel.hyperscan_db(tuple(_COLLECT_FUSABLE[tag] for tag in fused)) if fused else None
+
+            for string in strings:
+                counted = []
+                if db is not None:
+                    found = accel.hyperscan_findall(db, len(fused), string)
+                    counted.extend(zip(fused, map(Counter, found)))
+                for _tag, func in rest:
+                    counted.append(func(string))
+                for tag, counter in counted:
+                    result[tag].update(counter)
+        return {tag: dict(c) for tag, c in result.items()}
 
     def regexp(self, regular_expression: str) -> Job:
         """
@@ -477,10 +1100,12 @@ class CollectionJob(Job):
         :return: The instance of Job to be chained.
         """
 
+        pattern = _compile(regular_expression)
+
         def _regexp(s_: str) -> Tuple[str, Counter]:
-            return 'regexp', Counter(re.findall(regular_expression, s_))
+            return 'regexp', Counter(pattern.findall(s_))
 
-        self.f.append(_regexp)
+        self.f.append(('regexp', {'regular_expression': regular_expression}, _regexp))
         return self
 
     def url(self) -> Job:
@@ -490,10 +1115,7 @@ class CollectionJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _url(s_: str) -> Tuple[str, Counter]:
-            return 'url', Counter(re.findall(r'https?://\S+', s_))
-
-        self.f.append(_url)
+        self.f.append(('url', {}, _collect_url))
         return self
 
     def nickname(self) -> Job:
@@ -503,10 +1125,7 @@ class CollectionJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _nickname(s_: str) -> Tuple[str, Counter]:
-            return 'nickname', Counter(re.findall(r'@\w+', s_))
-
-        self.f.append(_nickname)
+        self.f.append(('nickname', {}, _collect_nickname))
         return self
 
     def hashtag(self) -> Job:
@@ -516,10 +1135,7 @@ class CollectionJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _hashtag(s_: str) -> Tuple[str, Counter]:
-            return 'hashtag', Counter(re.findall(r'#\w+', s_))
-
-        self.f.append(_hashtag)
+        self.f.append(('hashtag', {}, _collect_hashtag))
         return self
 
     def punctuation(self) -> Job:
@@ -530,10 +1146,7 @@ class CollectionJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _punctuation(s_: str) -> Tuple[str, Counter]:
-            return 'punctuation', Counter(re.findall(r'[^\w\s]', s_))
-
-        self.f.append(_punctuation)
+        self.f.append(('punctuation', {}, _collect_punctuation))
         return self
 
     def whitespace(self) -> Job:
@@ -544,14 +1157,7 @@ class CollectionJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _whitespace(s_: str) -> Tuple[str, Counter]:
-            c = Counter()
-            for ch in ['\t', '\n', '\r', '\v', '\f']:
-                if ch in s_:
-                    c[ch] = len(re.findall(ch, s_))
-            return 'whitespace', c
-
-        self.f.append(_whitespace)
+        self.f.append(('whitespace', {}, _collect_whitespace))
         return self
 
     def html(self) -> Job:
@@ -561,10 +1167,7 @@ class CollectionJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _html(s_: str) -> Tuple[str, Counter]:
-            return 'html', Counter(re.findall(r'<.*?>', s_))
-
-        self.f.append(_html)
+        self.f.append(('html', {}, _collect_html))
         return self
 
     def emoji(self) -> Job:
@@ -574,15 +1177,7 @@ class CollectionJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _emoji(s_: str) -> Tuple[str, Counter]:
-            c = Counter()
-            for e in EMOJI:
-                emojis_number = s_.count(e)
-                if emojis_number > 0:
-                    c[EMOJI[e]] = emojis_number
-            return 'emoji', c
-
-        self.f.append(_emoji)
+        self.f.append(('emoji', {}, _collect_emoji))
         return self
 
     def emoticon(self, ignore_emoji=True, ignore_url=True) -> Job:
@@ -594,18 +1189,23 @@ class CollectionJob(Job):
         :return: The instance of Job to be chained.
         """
 
-        def _emoticon(s_: str) -> Tuple[str, Counter]:
-            if ignore_url:
-                s_ = re.sub(r'https?://\S+', ' ', s_)
-            if ignore_emoji:
-                for e in reversed(list(EMOJI.keys())):
-                    s_ = s_.replace(e, ' ')
-            c = Counter()
-            for e in EMOTICONS:
-                emoticons_number = len(re.findall(e, s_))
-                if emoticons_number > 0:
-                    c[EMOTICONS[e]] = emoticons_number
-            return 'emoticon', c
-
-        self.f.append(_emoticon)
+        self.f.append(('emoticon', {'ignore_emoji': ignore_emoji, 'ignore_url': ignore_url},
+                       _collect_emoticon_with(ignore_emoji, ignore_url)))
         return self
+
+
+def _collect_chunk(plan: Tuple, strings: List[str]) -> Dict[str, Dict]:
+    """
+    Worker helper: rebuilds a CollectionJob from its serializable plan and counts a chunk.
+
+    :param plan: (tag, sorted parameter items) per chained stage.
+    :param strings: The chunk of strings to process.
+    :return: The counted patterns for the chunk.
+    """
+
+    job = CollectionJob()
+    for tag, params in plan:
+        getattr(job, tag)(**dict(params))
+    # workers=1 keeps the chunk in-process: the auto-parallel default would
+    # otherwise re-trigger inside every worker and fork nested pools.
+    return job.batch_execute(strings, workers=1)
@@ -18,6 +18,18 @@ setup(
     url='https://github.com/iaramer/dobbi',
     download_url='https://github.com/iaramer/dobbi/archive/refs/tags/v0_13.tar.gz',
     keywords=['nlp', 'text', 'string', 'regexp', 'preprocess', 'clean'],
+    extras_require={
+        # Optional compiled accelerators; dobbi.accel picks up whichever are
+        # installed and falls back to pure Python otherwise.
+        'speedups': [
+            'pyahocorasick',
+            'numpy',
+            'numba',
+            'hyperscan',
+            'google-re2',
+            'pyarrow',
+        ],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
 
@@ -20,6 +20,30 @@ def test_clean_emoticons():
     assert dobbi_result == actual
 
 
+def test_execute_twice_is_stable():
+    job = dobbi.clean().url().hashtag()
+    string = '#fun   Check here: https://some-url.com'
+    first = job.execute(string)
+    second = job.execute(string)
+    assert first == second == 'Check here:'
+
+
+def test_replace_execute_twice_is_stable():
+    job = dobbi.replace().url('TOKEN_URL').nickname()
+    string = '@alex33   check https://some-url.com'
+    first = job.execute(string)
+    second = job.execute(string)
+    assert first == second == 'TOKEN_NICKNAME check TOKEN_URL'
+
+
+def test_clean_html_unclosed_tags():
+    string = '<' * 10000 + '>text'
+    dobbi_result = dobbi.clean() \
+        .html() \
+        .execute(string)
+    assert dobbi_result == 'text'
+
+
 def test_replace_emoticons():
     string = ':)word1:Dword2'
     dobbi_result = dobbi.replace() \